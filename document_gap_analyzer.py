@@ -7,6 +7,8 @@
 !pip install streamlit
 !pip install pandas
 !pip install matplotlib
+!pip install psutil
+!pip install numpy scipy
 
 # Clone the open source repositories
 !git clone https://github.com/innolitics/rdm.git
@@ -55,28 +57,20 @@ print("✅ Environment setup complete!")
 
 # Cell 3: Document Processing Functions
 def extract_pdf_text(pdf_path: str) -> str:
-    """Extract text from PDF using pdfplumber"""
+    """Extract text from PDF using pdfplumber (errors are reported by the extraction supervisor)"""
     text_content = ""
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text_content += page.extract_text() or ""
-    except Exception as e:
-        print(f"Error extracting PDF: {e}")
-        return ""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            text_content += page.extract_text() or ""
     return text_content
 
 def extract_docx_text(docx_path: str) -> str:
-    """Extract text from Word document"""
-    try:
-        doc = Document(docx_path)
-        text_content = ""
-        for paragraph in doc.paragraphs:
-            text_content += paragraph.text + "\n"
-        return text_content
-    except Exception as e:
-        print(f"Error extracting DOCX: {e}")
-        return ""
+    """Extract text from Word document (errors are reported by the extraction supervisor)"""
+    doc = Document(docx_path)
+    text_content = ""
+    for paragraph in doc.paragraphs:
+        text_content += paragraph.text + "\n"
+    return text_content
 
 def process_document(file_path: str) -> str:
     """Process document based on file extension"""
@@ -92,6 +86,255 @@ def process_document(file_path: str) -> str:
 # Test the functions
 print("✅ Document processing functions ready!")
 
+# Cell 3A: Supervised Extraction Workers
+import multiprocessing
+import time
+from collections import deque
+import threading
+from multiprocessing.connection import wait as wait_for_connections
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Fall back to /proc on Linux
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows: no hard address-space cap, polling only
+
+# Limits applied to every document (set to None to disable)
+EXTRACTION_TIMEOUT_SECONDS = 120
+EXTRACTION_MAX_RSS_MB = 1024
+EXTRACTION_MAX_JOBS_PER_WORKER = 25
+EXTRACTION_NUM_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+EXTRACTION_POLL_SECONDS = 0.5
+
+# Held while forking workers; background threads hold it while they print or
+# take other locks a freshly forked child might need
+EXTRACTION_FORK_LOCK = threading.Lock()
+
+def _extraction_context():
+    """Fork context, or None where fork is unavailable (spawned workers can't see notebook functions)"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+def _extract_document_result(file_path: str) -> Tuple:
+    """Run process_document and return (status, text, reason, elapsed_seconds)"""
+    started = time.monotonic()
+    try:
+        text = process_document(file_path)
+        if text.strip():
+            status, reason = "success", None
+        else:
+            status, text, reason = "failed", "", "no text could be extracted"
+    except MemoryError:
+        status, text, reason = "failed", "", "memory limit exceeded"
+    except Exception as e:
+        status, text, reason = "failed", "", f"{type(e).__name__}: {e}"
+    return status, text, reason, round(time.monotonic() - started, 2)
+
+def _process_memory_mb(pid: int = None, virtual: bool = False):
+    """Resident (or virtual) memory of a process in MB, or None if it cannot be read"""
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            info = psutil.Process(pid).memory_info()
+            return (info.vms if virtual else info.rss) / (1024 * 1024)
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            pages = int(f.read().split()[0 if virtual else 1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def _cap_worker_address_space(max_rss_mb: float):
+    """Hard-cap the worker's address space at its size after fork plus max_rss_mb.
+
+    Polling can miss an allocation that grows by gigabytes between samples;
+    with the cap such an allocation raises MemoryError inside the worker.
+    """
+    if resource is None or not max_rss_mb:
+        return
+    current_mb = _process_memory_mb(virtual=True)
+    if current_mb is None:
+        return
+    limit = int((current_mb + max_rss_mb) * 1024 * 1024)
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError, AttributeError):
+        pass  # Not supported on this platform; the supervisor's polling still applies
+
+def _extraction_worker(conn, max_rss_mb: float = None):
+    """Worker loop: receive file paths, send back (status, text, reason, elapsed_seconds)"""
+    _cap_worker_address_space(max_rss_mb)
+    while True:
+        try:
+            file_path = conn.recv()
+        except EOFError:
+            break
+        if file_path is None:
+            break
+        result = _extract_document_result(file_path)
+        conn.send(result)
+        if result[2] == "memory limit exceeded":
+            break  # Heap may be fragmented; let the supervisor start a fresh worker
+    conn.close()
+
+def _start_extraction_worker(ctx, max_rss_mb: float = None) -> Dict:
+    """Spawn a worker process with its own private pipe"""
+    parent_conn, child_conn = ctx.Pipe()
+    process = ctx.Process(target=_extraction_worker, args=(child_conn, max_rss_mb), daemon=True)
+    with EXTRACTION_FORK_LOCK:
+        process.start()
+    child_conn.close()
+    # A forked child starts out counting the parent's resident pages, so the
+    # memory limit applies to growth above this baseline
+    baseline_mb = _process_memory_mb(process.pid) or 0
+    return {"process": process, "conn": parent_conn, "file_path": None, "started": None,
+            "jobs_done": 0, "rss_baseline_mb": baseline_mb}
+
+def _stop_extraction_worker(worker: Dict, force: bool = False):
+    """Stop a worker, politely unless it is stuck or over its limits"""
+    process = worker["process"]
+    if not force and process.is_alive():
+        try:
+            worker["conn"].send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        process.join(timeout=5)
+    if process.is_alive():
+        process.terminate()
+        process.join(timeout=5)
+    if process.is_alive():
+        process.kill()
+        process.join()
+    worker["conn"].close()
+
+def iter_supervised_extractions(file_paths: List[str],
+                                timeout_seconds: float = EXTRACTION_TIMEOUT_SECONDS,
+                                max_rss_mb: float = EXTRACTION_MAX_RSS_MB,
+                                max_jobs_per_worker: int = EXTRACTION_MAX_JOBS_PER_WORKER,
+                                num_workers: int = EXTRACTION_NUM_WORKERS):
+    """Extract documents in supervised worker processes, yielding results as they finish.
+
+    Each result is a dict with file_path, status ("success"/"failed"), text, reason
+    and elapsed_seconds. A worker that hangs past timeout_seconds, grows more than
+    max_rss_mb above its size at fork or dies is killed and replaced, and only its
+    current file fails. Where supported, max_rss_mb is also a hard address-space cap.
+    Workers are also recycled after max_jobs_per_worker documents.
+    Where fork is unavailable, documents are extracted in-process without limits.
+    """
+    ctx = _extraction_context()
+    if ctx is None:
+        for file_path in file_paths:
+            status, text, reason, elapsed = _extract_document_result(str(file_path))
+            yield {"file_path": str(file_path), "status": status, "text": text,
+                   "reason": reason, "elapsed_seconds": elapsed}
+        return
+
+    pending = deque(str(path) for path in file_paths)
+    workers = [_start_extraction_worker(ctx, max_rss_mb)
+               for _ in range(min(max(1, num_workers), len(pending)))]
+
+    def finish(worker, status, text, reason, elapsed=None):
+        if elapsed is None:
+            elapsed = round(time.monotonic() - worker["started"], 2)
+        result = {
+            "file_path": worker["file_path"],
+            "status": status,
+            "text": text,
+            "reason": reason,
+            "elapsed_seconds": elapsed
+        }
+        worker["file_path"] = None
+        worker["started"] = None
+        worker["jobs_done"] += 1
+        return result
+
+    try:
+        while pending or any(w["file_path"] is not None for w in workers):
+            # Results are only yielded at the end of each pass, so time the caller
+            # spends on a yielded result never counts against a running worker
+            results = []
+
+            # Hand out work, recycling workers that are dead or have done enough jobs
+            for i, worker in enumerate(workers):
+                if worker["file_path"] is not None or not pending:
+                    continue
+                if not worker["process"].is_alive() or (
+                        max_jobs_per_worker and worker["jobs_done"] >= max_jobs_per_worker):
+                    _stop_extraction_worker(worker)
+                    worker = workers[i] = _start_extraction_worker(ctx, max_rss_mb)
+                worker["file_path"] = pending.popleft()
+                worker["started"] = time.monotonic()
+                try:
+                    worker["conn"].send(worker["file_path"])
+                except (BrokenPipeError, OSError):
+                    results.append(finish(worker, "failed", "", "worker unavailable"))
+
+            # Wait for something to finish, then collect every job that has
+            busy = [w for w in workers if w["file_path"] is not None]
+            wait_for_connections([w["conn"] for w in busy], timeout=EXTRACTION_POLL_SECONDS)
+            now = time.monotonic()
+            for worker in busy:
+                if not worker["conn"].poll():
+                    continue
+                try:
+                    status, text, reason, elapsed = worker["conn"].recv()
+                except (EOFError, OSError):
+                    continue  # Worker died; reported below
+                results.append(finish(worker, status, text, reason, elapsed))
+
+            # Enforce limits on whatever is still running
+            for i, worker in enumerate(workers):
+                if worker["file_path"] is None:
+                    continue
+                process = worker["process"]
+                reason = None
+                if not process.is_alive():
+                    reason = f"worker exited unexpectedly (exit code {process.exitcode})"
+                elif timeout_seconds and now - worker["started"] > timeout_seconds:
+                    reason = f"timed out after {timeout_seconds}s"
+                elif max_rss_mb:
+                    rss_mb = _process_memory_mb(process.pid)
+                    growth_mb = rss_mb - worker["rss_baseline_mb"] if rss_mb is not None else None
+                    if growth_mb is not None and growth_mb > max_rss_mb:
+                        reason = f"memory limit exceeded (grew {growth_mb:.0f} MB > {max_rss_mb} MB)"
+                if reason:
+                    _stop_extraction_worker(worker, force=True)
+                    results.append(finish(worker, "failed", "", reason))
+                    workers[i] = _start_extraction_worker(ctx, max_rss_mb)
+
+            yield from results
+    finally:
+        for worker in workers:
+            _stop_extraction_worker(worker, force=worker["file_path"] is not None)
+
+def extract_documents_supervised(file_paths: List[str], **limits) -> Dict[str, Dict]:
+    """Extract a batch of documents and report per-file results"""
+    results = {}
+    for result in iter_supervised_extractions(file_paths, **limits):
+        results[result["file_path"]] = result
+        if result["status"] == "success":
+            print(f"✅ {Path(result['file_path']).name}: {len(result['text'])} characters")
+        else:
+            print(f"❌ {Path(result['file_path']).name}: {result['reason']}")
+    return results
+
+def extract_document_supervised(file_path: str, **limits) -> Dict:
+    """Extract a single document in a supervised worker"""
+    limits.setdefault("num_workers", 1)
+    return list(iter_supervised_extractions([file_path], **limits))[0]
+
+print("✅ Supervised extraction workers ready!")
+
 # Cell 4: Create ISO 14971 Risk Management Checklist
 iso_14971_checklist = {
     "Risk Management Process": [
@@ -132,6 +375,232 @@ with open('reference_checklists/iso_14971_checklist.json', 'w') as f:
 print("✅ ISO 14971 checklist created and saved!")
 print(f"Total requirements: {sum(len(items) for items in iso_14971_checklist.values())}")
 
+# Cell 4A: Corpus Coverage Matrix for Triage Ranking
+import numpy as np
+import scipy.sparse as sp
+
+COVERAGE_GAP_THRESHOLD = 0.5  # Requirements covered below this count as likely gaps
+COVERAGE_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'of', 'on', 'or', 'the', 'to', 'where', 'with'
+}
+_TOKEN_PATTERN = re.compile(r"[a-z]{2,}")  # Hyphenated words split: post-production -> post, production
+
+# Derivational suffixes, longest first, and what they reduce to
+_COVERAGE_DERIVATIONS = (
+    ('ification', 'ify'), ('isation', 'ize'), ('ization', 'ize'), ('ational', 'ate'),
+    ('ation', 'ate'), ('ment', ''), ('ness', ''), ('sion', 's'), ('tion', 't'), ('ous', '')
+)
+
+def _coverage_stem(word: str) -> str:
+    """Light Porter-style stemming so inflected and derived forms share a term.
+
+    e.g. evaluate/evaluated/evaluation, identified/identification,
+    hazards/hazardous, processes/process and managed/management.
+    """
+    # Inflections
+    if word.endswith(('ies', 'ied')) and len(word) > 4:
+        word = word[:-3] + 'y'
+    elif word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith(('ing', 'ed')):
+        stem = word[:-3] if word.endswith('ing') else word[:-2]
+        if len(stem) >= 3:
+            word = stem
+            if word.endswith(('at', 'iz')):
+                word += 'e'
+            elif word[-1] == word[-2] and word[-1] not in 'aeious':
+                word = word[:-1]  # controlled -> control
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')) and len(word) > 3:
+        word = word[:-1]
+
+    # Derivations, repeated so documentation -> documentate -> document -> docu
+    # lands where documented does
+    while True:
+        previous = word
+        for suffix, replacement in _COVERAGE_DERIVATIONS:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                word = word[:-len(suffix)] + replacement
+                break
+        if word.endswith('ate') and len(word) - 3 >= 4:
+            word = word[:-3]
+        if word == previous:
+            break
+
+    if word.endswith('ll'):
+        word = word[:-1]
+    if word.endswith('e') and len(word) > 3:
+        word = word[:-1]
+    return word
+
+def _coverage_terms(text: str) -> List[str]:
+    """Lowercase, tokenize, drop stopwords and stem"""
+    return [_coverage_stem(token) for token in _TOKEN_PATTERN.findall(text.lower())
+            if token not in COVERAGE_STOPWORDS]
+
+def build_coverage_index(checklist: Dict = None) -> Dict:
+    """Create an empty coverage index over the checklist requirements.
+
+    The vocabulary is fixed to the requirement terms, so adding documents
+    only appends rows and never changes the matrix columns.
+    """
+    checklist = checklist or iso_14971_checklist
+    requirements = [(category, item) for category, items in checklist.items() for item in items]
+
+    vocabulary = {}
+    rows, cols = [], []
+    for req_idx, (_, item) in enumerate(requirements):
+        for term in set(_coverage_terms(item)):
+            rows.append(req_idx)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+    requirement_terms = sp.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(requirements), len(vocabulary))
+    )
+
+    return {
+        "requirements": pd.MultiIndex.from_tuples(requirements, names=["category", "requirement"]),
+        "vocabulary": vocabulary,
+        "requirement_terms": requirement_terms,
+        "doc_ids": [],
+        "suppliers": [],
+        "doc_terms": sp.csr_matrix((0, len(vocabulary)), dtype=np.float64),
+        "token_cache": {},  # raw token -> vocabulary column (or None)
+        "lock": threading.Lock()  # guards doc_terms/doc_ids/suppliers, which change together
+    }
+
+def _text_columns(index: Dict, text: str) -> set:
+    """Vocabulary columns of the requirement terms that appear in a text"""
+    vocabulary = index["vocabulary"]
+    token_cache = index["token_cache"]
+    columns = set()
+    for token in set(_TOKEN_PATTERN.findall(text.lower())):
+        if token not in token_cache:
+            term = None if token in COVERAGE_STOPWORDS else _coverage_stem(token)
+            token_cache[token] = vocabulary.get(term)
+        columns.add(token_cache[token])
+    columns.discard(None)
+    return columns
+
+def coverage_terms_for_text(index: Dict, text: str) -> List[str]:
+    """Requirement terms present in a text, compact enough to store instead of the text"""
+    terms = list(index["vocabulary"])
+    return sorted(terms[column] for column in _text_columns(index, text))
+
+def _append_coverage_rows(index: Dict, documents: List[Tuple[str, str, set]]):
+    """Add (doc_id, supplier_name, columns) rows, replacing existing doc_ids"""
+    documents = list({doc_id: (doc_id, supplier, columns) for doc_id, supplier, columns in documents}.values())
+    if not documents:
+        return index
+
+    # Build the sparse documents x terms presence matrix for the whole batch at once
+    indices, indptr = [], [0]
+    for _, _, columns in documents:
+        indices.extend(sorted(columns))
+        indptr.append(len(indices))
+    new_terms = sp.csr_matrix(
+        (np.ones(len(indices)), indices, indptr), shape=(len(documents), len(index["vocabulary"]))
+    )
+
+    new_ids = [doc_id for doc_id, _, _ in documents]
+    replaced = set(new_ids)
+    with index["lock"]:
+        doc_terms, doc_ids, suppliers = index["doc_terms"], index["doc_ids"], index["suppliers"]
+        if replaced & set(doc_ids):
+            keep = [i for i, doc_id in enumerate(doc_ids) if doc_id not in replaced]
+            doc_terms = doc_terms[keep]
+            doc_ids = [doc_ids[i] for i in keep]
+            suppliers = [suppliers[i] for i in keep]
+
+        # Build new objects and swap them in together; readers hold a consistent snapshot
+        index.update({
+            "doc_terms": sp.vstack([doc_terms, new_terms], format='csr'),
+            "doc_ids": doc_ids + new_ids,
+            "suppliers": suppliers + [supplier for _, supplier, _ in documents]
+        })
+    return index
+
+def add_documents_to_coverage_index(index: Dict, documents: List[Tuple[str, str, str]]):
+    """Add (doc_id, supplier_name, text) documents in one batched pass.
+
+    Re-adding an existing doc_id replaces its row, so changed documents can
+    simply be added again. Within a batch the last entry for a doc_id wins.
+    Safe to call while other threads rank the same index.
+    """
+    return _append_coverage_rows(index, [(doc_id, supplier, _text_columns(index, text))
+                                         for doc_id, supplier, text in documents])
+
+def add_term_sets_to_coverage_index(index: Dict, documents: List[Tuple[str, str, List[str]]]):
+    """Add (doc_id, supplier_name, terms) documents saved with coverage_terms_for_text"""
+    vocabulary = index["vocabulary"]
+    return _append_coverage_rows(index, [
+        (doc_id, supplier, {vocabulary[term] for term in terms if term in vocabulary})
+        for doc_id, supplier, terms in documents
+    ])
+
+def _coverage_snapshot(index: Dict) -> Tuple:
+    """Matching (doc_terms, doc_ids, suppliers), even while documents are being added"""
+    with index["lock"]:
+        return index["doc_terms"], index["doc_ids"], index["suppliers"]
+
+def compute_coverage_matrix(index: Dict) -> pd.DataFrame:
+    """Score every document against every requirement (documents x requirements).
+
+    Each score is the IDF-weighted share of a requirement's terms present in
+    the document, between 0 (nothing mentioned) and 1 (all terms present).
+    Terms that appear in every document carry little weight.
+    """
+    presence, doc_ids, _ = _coverage_snapshot(index)
+    return _score_coverage(index, presence, doc_ids)
+
+def _score_coverage(index: Dict, presence, doc_ids: List[str]) -> pd.DataFrame:
+    """Coverage matrix for one snapshot of the index"""
+    n_docs = presence.shape[0]
+
+    # Smoothed IDF over the current corpus, recomputed as documents arrive
+    doc_freq = np.asarray(presence.sum(axis=0)).ravel()
+    idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+
+    weights = index["requirement_terms"].multiply(idf).tocsr()
+    row_totals = np.asarray(weights.sum(axis=1)).ravel()
+    weights = sp.diags(1 / np.where(row_totals > 0, row_totals, 1)) @ weights
+
+    coverage = (presence @ weights.T).toarray()
+    return pd.DataFrame(coverage, index=pd.Index(doc_ids, name="document"),
+                        columns=index["requirements"])
+
+def rank_suppliers_by_coverage(index: Dict, gap_threshold: float = COVERAGE_GAP_THRESHOLD) -> pd.DataFrame:
+    """Triage list of suppliers, weakest requirement coverage first.
+
+    A supplier covers a requirement as well as its best document does.
+    """
+    presence, doc_ids, suppliers = _coverage_snapshot(index)
+    coverage = _score_coverage(index, presence, doc_ids)
+    supplier_coverage = coverage.groupby(pd.Index(suppliers, name="supplier")).max()
+
+    category_coverage = supplier_coverage.T.groupby(level="category").mean().T
+    triage = pd.DataFrame({
+        "documents": pd.Series(suppliers).value_counts(),
+        "likely_gaps": (supplier_coverage < gap_threshold).sum(axis=1),
+        "mean_coverage": supplier_coverage.mean(axis=1).round(3),
+        "weakest_category": category_coverage.idxmin(axis=1)
+    })
+    triage = triage.sort_values(["likely_gaps", "mean_coverage"], ascending=[False, True])
+    triage.insert(0, "rank", range(1, len(triage) + 1))
+    return triage
+
+def triage_intake_batch(file_paths: List[str], supplier_names: List[str] = None,
+                        index: Dict = None, **limits) -> pd.DataFrame:
+    """Extract a batch of documents and rank their suppliers before any AI calls"""
+    index = index or build_coverage_index()
+    suppliers = dict(zip(map(str, file_paths), supplier_names or [Path(p).stem for p in file_paths]))
+    documents = [(result["file_path"], suppliers[result["file_path"]], result["text"])
+                 for result in iter_supervised_extractions(file_paths, **limits)
+                 if result["status"] == "success"]
+    add_documents_to_coverage_index(index, documents)
+    return rank_suppliers_by_coverage(index)
+
+print("✅ Coverage triage engine ready!")
+
 # Cell 5: School AI Prompt Generation (Replaces GPT Integration)
 import json
 from typing import Dict
@@ -189,19 +658,22 @@ Focus on practical regulatory compliance for medical device risk management. Be
     
     return prompt
 
-def generate_school_ai_analysis_package(file_path: str, supplier_name: str = "Unknown Supplier"):
-    """Generate complete package for school AI analysis"""
+def generate_school_ai_analysis_package(file_path: str, supplier_name: str = "Unknown Supplier",
+                                        document_text: str = None, prompt_name: str = None):
+    """Generate complete package for school AI analysis (pass document_text if already extracted)"""
     
     print(f"📝 Generating school AI package for: {supplier_name}")
     print(f"📄 Document: {file_path}")
     
     try:
         # Step 1: Extract document text
-        print("📖 Extracting document text...")
-        document_text = process_document(file_path)
-        
-        if not document_text.strip():
-            return {"error": "Could not extract text from document", "status": "failed"}
+        if document_text is None:
+            print("📖 Extracting document text...")
+            extraction = extract_document_supervised(file_path)
+            document_text = extraction["text"]
+
+            if extraction["status"] != "success":
+                return {"error": f"Could not extract text from document: {extraction['reason']}", "status": "failed"}
         
         print(f"✅ Extracted {len(document_text)} characters")
         
@@ -220,7 +692,8 @@ def generate_school_ai_analysis_package(file_path: str, supplier_name: str = "Un
         
         # Step 4: Save prompt file
         timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M')
-        prompt_filename = f"SCHOOL_AI_PROMPT_{supplier_name.replace(' ', '_')}_{timestamp}.txt"
+        prompt_name = prompt_name or supplier_name  # e.g. "Acme plan" when a supplier sends several files
+        prompt_filename = f"SCHOOL_AI_PROMPT_{prompt_name.replace(' ', '_')}_{timestamp}.txt"
         prompt_path = f'output_reports/{prompt_filename}'
         
         with open(prompt_path, 'w', encoding='utf-8') as f:
@@ -304,21 +777,36 @@ def format_school_ai_response_to_memo(response_data: dict) -> str:
     if not response_data:
         return "Error: No response data provided"
     
-    ai_response = response_data["ai_response"]
-    supplier_name = response_data["supplier_name"]
-    ai_tool = response_data["ai_tool"]
-    
-    # Create professional memo header
-    memo_content = f"""# GAP ANALYSIS MEMO
+    return render_memo_markdown(response_data)
+
+print("✅ School AI response processing functions ready!")
+
+# Cell 6A: Memo Rendering Engine
+import csv
+import io
+import zipfile
+from collections import Counter
+from xml.sax.saxutils import escape
+
+MEMO_FORMATS = ('md', 'docx', 'csv')
+MEMO_STATUSES = ["Met", "Partially Met", "Not Met", "Not Applicable"]
+MEMO_RISK_LEVELS = ["Critical", "Major", "Minor"]
+MEMO_STATUS_ICONS = {"Met": "✅", "Partially Met": "⚠️", "Not Met": "❌", "Not Applicable": "➖"}
+MEMO_RISK_ICONS = {"Critical": "🔴", "Major": "🟡", "Minor": "🟢"}
+MEMO_OTHER = "Other/Unspecified"  # Summary bucket for missing or unrecognized values
+MEMO_CSV_COLUMNS = ["supplier_name", "number", "category", "requirement",
+                    "status", "risk_level", "evidence", "gap"]
+
+SCHOOL_AI_MEMO_TEMPLATE = """# GAP ANALYSIS MEMO
 **Supplier:** {supplier_name}
 **Standard:** ISO 14971 Risk Management for Medical Devices
-**Analysis Date:** {pd.Timestamp.now().strftime('%Y-%m-%d')}
+**Analysis Date:** {analysis_date}
 **Analysis Method:** {ai_tool} (School AI Access)
 **Analyst:** Automated Gap Analysis Tool
 
 ## EXECUTIVE SUMMARY
 Comprehensive document analysis completed using institutional AI resources against ISO 14971 requirements. This memo provides a systematic assessment of compliance gaps and recommendations for regulatory submission readiness.
-
+{results_section}
 ## DETAILED ANALYSIS RESULTS
 
 {ai_response}
@@ -349,17 +837,353 @@ Based on the analysis above, the following actions are recommended:
 
 ---
 **Document Information:**
-- Analysis completed: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}
+- Analysis completed: {analysis_time}
 - AI Tool used: {ai_tool}
-- Response length: {response_data.get('response_length', 'Unknown')} characters
+- Response length: {response_length} characters
 - Generated by: Document Gap Analyzer MVP (School AI Version)
 
 *This analysis was performed using institutional AI resources at no cost to the project.*
 """
-    
-    return memo_content
 
-print("✅ School AI response processing functions ready!")
+# Memo layout of the original notebook (generate_gap_memo)
+GAP_MEMO_TEMPLATE = """
+# GAP ANALYSIS MEMO
+**Supplier:** {supplier_name}
+**Standard:** ISO 14971 Risk Management
+**Analysis Date:** {analysis_date}
+
+## EXECUTIVE SUMMARY
+Document analysis completed against ISO 14971 requirements.
+{results_section}
+## DETAILED FINDINGS
+{ai_response}
+
+## RECOMMENDATIONS
+Based on the gaps identified, the following actions are recommended:
+1. Request additional documentation for critical gaps
+2. Clarify requirements for partially met items
+3. Schedule follow-up review after supplier responses
+
+---
+*Generated by Automated Document Gap Analyzer*
+"""
+
+RESULTS_SECTION_TEMPLATE = """
+## COMPLIANCE SUMMARY
+| Status | Count |
+|---|---|
+{status_rows}
+
+| Gap Risk Level | Count |
+|---|---|
+{risk_rows}
+
+## REQUIREMENT RESULTS
+| # | Category | Requirement | Status | Risk | Evidence | Gap |
+|---|---|---|---|---|---|---|
+{requirement_rows}
+"""
+
+_TEMPLATE_FIELD_PATTERN = re.compile(r"\{(\w+)\}")
+
+def compile_memo_template(template: str) -> List:
+    """Split a template once into literal text and field names.
+
+    Odd positions hold field names, so rendering is a single join with no
+    re-parsing of the template.
+    """
+    return _TEMPLATE_FIELD_PATTERN.split(template)
+
+def _render_compiled(parts: List, values: Dict) -> str:
+    """Fill a compiled template"""
+    return "".join(part if i % 2 == 0 else str(values[part]) for i, part in enumerate(parts))
+
+MEMO_TEMPLATES = {
+    "school_ai": compile_memo_template(SCHOOL_AI_MEMO_TEMPLATE),
+    "gap": compile_memo_template(GAP_MEMO_TEMPLATE)
+}
+_COMPILED_RESULTS_SECTION = compile_memo_template(RESULTS_SECTION_TEMPLATE)
+
+def _normalize_label(value, labels: List[str]) -> str:
+    """Match 'not met', 'NOT_MET' etc. to the canonical label"""
+    if not value:
+        return ""
+    key = str(value).replace('_', ' ').strip().lower()
+    for label in labels:
+        if label.lower() == key:
+            return label
+    return str(value).strip()
+
+def _memo_cell(value) -> str:
+    """Make a value safe for a markdown table cell"""
+    return str(value or "").replace("|", "\\|").replace("\n", " ").strip()
+
+def _summary_bucket(value, labels: List[str]) -> str:
+    """Canonical label, or MEMO_OTHER for anything missing or unrecognized"""
+    label = _normalize_label(value, labels)
+    return label if label in labels else MEMO_OTHER
+
+def summarize_requirement_results(results: List[Dict]) -> Dict:
+    """Count per-requirement results by status and by gap risk level.
+
+    Status counts always add up to total. Risk counts cover results that
+    carry a risk level.
+    """
+    status_counts = Counter(_summary_bucket(r.get("status"), MEMO_STATUSES) for r in results)
+    risk_counts = Counter(_summary_bucket(r.get("risk_level"), MEMO_RISK_LEVELS)
+                          for r in results if r.get("risk_level"))
+    return {
+        "total": len(results),
+        "by_status": {status: status_counts.get(status, 0) for status in MEMO_STATUSES + [MEMO_OTHER]},
+        "by_risk_level": {risk: risk_counts.get(risk, 0) for risk in MEMO_RISK_LEVELS + [MEMO_OTHER]}
+    }
+
+def _summary_rows(counts: Dict, icons: Dict) -> List[Tuple[str, int]]:
+    """(label, count) rows for display; the Other bucket only when it is used"""
+    return [(f"{icons.get(label, '')} {label}".strip(), count) for label, count in counts.items()
+            if label != MEMO_OTHER or count]
+
+def _render_results_section(results: List[Dict]) -> str:
+    """Summary counts and the per-requirement table, or nothing without results"""
+    if not results:
+        return ""
+    summary = summarize_requirement_results(results)
+    requirement_rows = []
+    for number, result in enumerate(results, 1):
+        status = _normalize_label(result.get("status"), MEMO_STATUSES)
+        risk = _normalize_label(result.get("risk_level"), MEMO_RISK_LEVELS)
+        status_label = f"{MEMO_STATUS_ICONS.get(status, '')} {status}".strip()
+        risk_label = f"{MEMO_RISK_ICONS.get(risk, '')} {risk}".strip()
+        requirement_rows.append(
+            f"| {_memo_cell(result.get('number', number))} | {_memo_cell(result.get('category'))} "
+            f"| {_memo_cell(result.get('requirement'))} | {_memo_cell(status_label)} | {_memo_cell(risk_label)} "
+            f"| {_memo_cell(result.get('evidence'))} | {_memo_cell(result.get('gap'))} |"
+        )
+    return _render_compiled(_COMPILED_RESULTS_SECTION, {
+        "status_rows": "\n".join(f"| {label} | {n} |"
+                                 for label, n in _summary_rows(summary["by_status"], MEMO_STATUS_ICONS)),
+        "risk_rows": "\n".join(f"| {label} | {n} |"
+                               for label, n in _summary_rows(summary["by_risk_level"], MEMO_RISK_ICONS)),
+        "requirement_rows": "\n".join(requirement_rows)
+    })
+
+def _memo_timestamps(generated_at=None) -> Dict:
+    """Format the generation time once for a whole batch"""
+    generated_at = generated_at if generated_at is not None else pd.Timestamp.now()
+    return {
+        "analysis_date": generated_at.strftime('%Y-%m-%d'),
+        "analysis_time": generated_at.strftime('%Y-%m-%d %H:%M'),
+        "file_stamp": generated_at.strftime('%Y%m%d_%H%M')
+    }
+
+def render_memo_markdown(memo: Dict, generated_at=None, timestamps: Dict = None,
+                         template: str = "school_ai") -> str:
+    """Render one memo to markdown.
+
+    memo holds supplier_name, ai_tool and either ai_response (raw AI text),
+    results (list of per-requirement dicts with category, requirement, status,
+    risk_level, evidence, gap) or both. template picks a layout from MEMO_TEMPLATES.
+    """
+    timestamps = timestamps or _memo_timestamps(generated_at)
+    results = memo.get("results") or []
+    ai_response = memo.get("ai_response") or "See REQUIREMENT RESULTS above."
+    return _render_compiled(MEMO_TEMPLATES[template], {
+        "supplier_name": memo.get("supplier_name", "Unknown Supplier"),
+        "ai_tool": memo.get("ai_tool", "School AI"),
+        "analysis_date": timestamps["analysis_date"],
+        "analysis_time": timestamps["analysis_time"],
+        "results_section": _render_results_section(results),
+        "ai_response": ai_response,
+        "response_length": memo.get("response_length", "Unknown")
+    })
+
+_MEMO_DOCX_TEXT_WIDTH = 8640  # Twips between the default template's page margins
+_XML_INVALID_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0d\x0e-\x1f\ufffe\uffff]")
+
+# WordprocessingML fragments, compiled once like the markdown templates
+_DOCX_RUN = compile_memo_template('<w:r>{run_properties}<w:t xml:space="preserve">{text}</w:t></w:r>')
+_DOCX_PARAGRAPH = compile_memo_template('<w:p>{paragraph_properties}{runs}</w:p>')
+_DOCX_CELL = compile_memo_template(
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr><w:p>{runs}</w:p></w:tc>'
+)
+_DOCX_TABLE = compile_memo_template(
+    '<w:tbl><w:tblPr>{table_style}<w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+    'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>'
+)
+
+_MEMO_DOCX_SKELETON = None  # Shared parts of a blank document, built on first use
+
+def _memo_docx_skeleton() -> Dict:
+    """Zip of every blank-document part except document.xml, plus that file around its body"""
+    global _MEMO_DOCX_SKELETON
+    if _MEMO_DOCX_SKELETON is None:
+        buffer = io.BytesIO()
+        Document().save(buffer)
+        parts = io.BytesIO()
+        with zipfile.ZipFile(buffer) as base, zipfile.ZipFile(parts, 'w', zipfile.ZIP_DEFLATED) as skeleton:
+            document_xml = base.read('word/document.xml').decode('utf-8')
+            has_table_grid = b'w:styleId="TableGrid"' in base.read('word/styles.xml')
+            for name in base.namelist():  # Keeps [Content_Types].xml first
+                if name != 'word/document.xml':
+                    skeleton.writestr(name, base.read(name))
+        body_start = document_xml.index('<w:body>') + len('<w:body>')
+        _MEMO_DOCX_SKELETON = {
+            "parts": parts.getvalue(),
+            "head": document_xml[:body_start],
+            "tail": document_xml[document_xml.index('<w:sectPr', body_start):],
+            "table_style": '<w:tblStyle w:val="TableGrid"/>' if has_table_grid else ""
+        }
+    return _MEMO_DOCX_SKELETON
+
+def _docx_run(value, bold: bool = False) -> str:
+    """One run of escaped text; newlines and tabs become Word breaks and tabs"""
+    text = escape(_XML_INVALID_CHARS.sub("", str(value if value is not None else "")))
+    text = (text.replace("\n", '</w:t><w:br/><w:t xml:space="preserve">')
+                .replace("\t", '</w:t><w:tab/><w:t xml:space="preserve">'))
+    return _render_compiled(_DOCX_RUN, {"run_properties": "<w:rPr><w:b/></w:rPr>" if bold else "",
+                                        "text": text})
+
+def _docx_paragraph(value, style: str = None, label: str = None) -> str:
+    """Paragraph in an optional style, with an optional bold 'label: ' prefix"""
+    return _render_compiled(_DOCX_PARAGRAPH, {
+        "paragraph_properties": f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else "",
+        "runs": (_docx_run(f"{label}: ", bold=True) if label else "") + _docx_run(value)
+    })
+
+def _docx_table(rows: List[Tuple], table_style: str) -> str:
+    """Table with equal column widths, like python-docx's add_table"""
+    width = _MEMO_DOCX_TEXT_WIDTH // len(rows[0])
+    return _render_compiled(_DOCX_TABLE, {
+        "table_style": table_style,
+        "grid": f'<w:gridCol w:w="{width}"/>' * len(rows[0]),
+        "rows": "".join(
+            "<w:tr>" + "".join(_render_compiled(_DOCX_CELL, {"width": width, "runs": _docx_run(value)})
+                               for value in row) + "</w:tr>"
+            for row in rows
+        )
+    })
+
+def write_memo_docx(memo: Dict, docx_path: str, generated_at=None, timestamps: Dict = None):
+    """Write one memo as a Word document built from the structured results.
+
+    Only document.xml is generated per memo; every other part is copied as
+    already-compressed bytes from a shared blank-document skeleton.
+    """
+    timestamps = timestamps or _memo_timestamps(generated_at)
+    results = memo.get("results") or []
+    skeleton = _memo_docx_skeleton()
+
+    body = [_docx_paragraph("GAP ANALYSIS MEMO", style="Title")]
+    body += [_docx_paragraph(value, label=label) for label, value in [
+        ("Supplier", memo.get("supplier_name", "Unknown Supplier")),
+        ("Standard", "ISO 14971 Risk Management for Medical Devices"),
+        ("Analysis Date", timestamps["analysis_date"]),
+        ("Analysis Method", f"{memo.get('ai_tool', 'School AI')} (School AI Access)")
+    ]]
+
+    if results:
+        summary = summarize_requirement_results(results)
+        summary_rows = [("Status / Risk Level", "Count")] + [
+            (label, count) for label, count in _summary_rows(summary["by_status"], {})
+            + _summary_rows(summary["by_risk_level"], {})
+        ]
+        requirement_rows = [("#", "Category", "Requirement", "Status", "Risk", "Evidence", "Gap")] + [
+            (result.get("number", number), result.get("category"), result.get("requirement"),
+             _normalize_label(result.get("status"), MEMO_STATUSES),
+             _normalize_label(result.get("risk_level"), MEMO_RISK_LEVELS),
+             result.get("evidence"), result.get("gap"))
+            for number, result in enumerate(results, 1)
+        ]
+        body += [_docx_paragraph("Compliance Summary", style="Heading1"),
+                 _docx_table(summary_rows, skeleton["table_style"]),
+                 _docx_paragraph("Requirement Results", style="Heading1"),
+                 _docx_table(requirement_rows, skeleton["table_style"])]
+
+    if memo.get("ai_response"):
+        body.append(_docx_paragraph("Detailed Analysis Results", style="Heading1"))
+        body += [_docx_paragraph(block) for block in memo["ai_response"].split("\n\n")]
+
+    body.append(_docx_paragraph(f"Analysis completed: {timestamps['analysis_time']} - "
+                                f"Generated by: Document Gap Analyzer MVP (School AI Version)"))
+
+    with open(docx_path, 'wb') as f:
+        f.write(skeleton["parts"])
+    with zipfile.ZipFile(docx_path, 'a', zipfile.ZIP_DEFLATED) as docx_file:
+        docx_file.writestr('word/document.xml', skeleton["head"] + "".join(body) + skeleton["tail"])
+
+def render_memo_batch(memos, output_dir: str = 'output_reports', formats=('md',), generated_at=None) -> Dict:
+    """Render a whole portfolio of memos, streaming each one to disk.
+
+    memos may be any iterable (including a generator). Markdown and DOCX are
+    written per supplier; CSV is one portfolio-wide file with a row per
+    requirement result.
+    """
+    unknown = set(formats) - set(MEMO_FORMATS)
+    if unknown:
+        raise ValueError(f"Unsupported memo format(s): {', '.join(sorted(unknown))}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamps = _memo_timestamps(generated_at)
+    used_names = Counter()
+    files = []
+    portfolio_counts = Counter()
+
+    csv_file = None
+    if 'csv' in formats:
+        csv_path = os.path.join(output_dir, f"GAP_RESULTS_{timestamps['file_stamp']}.csv")
+        csv_file = open(csv_path, 'w', newline='', encoding='utf-8')
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(MEMO_CSV_COLUMNS)
+        files.append(csv_path)
+
+    try:
+        memo_count = 0
+        for memo in memos:
+            memo_count += 1
+            supplier_name = memo.get("supplier_name", "Unknown Supplier")
+            results = memo.get("results") or []
+            portfolio_counts.update(summarize_requirement_results(results)["by_status"])
+
+            # Keep file names unique when a supplier appears more than once
+            safe_name = re.sub(r'[^\w.-]+', '_', supplier_name).strip('._') or "Unknown_Supplier"
+            base_name = f"GAP_MEMO_{safe_name}_{timestamps['file_stamp']}"
+            used_names[base_name] += 1
+            if used_names[base_name] > 1:
+                base_name += f"_{used_names[base_name]}"
+
+            if 'md' in formats:
+                md_path = os.path.join(output_dir, base_name + '.md')
+                with open(md_path, 'w', encoding='utf-8') as f:
+                    f.write(render_memo_markdown(memo, timestamps=timestamps))
+                files.append(md_path)
+            if 'docx' in formats:
+                docx_path = os.path.join(output_dir, base_name + '.docx')
+                write_memo_docx(memo, docx_path, timestamps=timestamps)
+                files.append(docx_path)
+            if csv_file is not None:
+                csv_writer.writerows(
+                    [supplier_name, result.get("number", number), result.get("category", ""),
+                     result.get("requirement", ""),
+                     _normalize_label(result.get("status"), MEMO_STATUSES),
+                     _normalize_label(result.get("risk_level"), MEMO_RISK_LEVELS),
+                     result.get("evidence", ""), result.get("gap", "")]
+                    for number, result in enumerate(results, 1)
+                )
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+
+    print(f"✅ Rendered {memo_count} memos ({', '.join(formats)}) to {output_dir}/")
+    return {
+        "status": "success",
+        "memo_count": memo_count,
+        "files": files,
+        "by_status": dict(portfolio_counts)
+    }
+
+print("✅ Memo rendering engine ready!")
 
 # Cell 7: Complete School AI Analysis Workflow
 def complete_school_ai_workflow(file_path: str, supplier_name: str = "Unknown Supplier"):
@@ -441,6 +1265,289 @@ def process_and_save_school_ai_analysis():
 
 print("✅ Complete school AI workflow ready!")
 
+# Cell 7A: Watch-Folder Intake Daemon
+import hashlib
+import queue
+
+INTAKE_FOLDERS = ['sample_documents']
+INTAKE_RECORD_PATH = 'output_reports/intake_record.json'
+INTAKE_POLL_SECONDS = 2
+INTAKE_SETTLE_SECONDS = 3  # File must be unchanged this long before it is picked up
+INTAKE_MAX_BATCH = 2 * EXTRACTION_NUM_WORKERS
+INTAKE_EXTENSIONS = {'.pdf', '.docx', '.doc'}
+INTAKE_IGNORED_SUFFIXES = ('.part', '.crdownload', '.tmp', '.partial')
+INTAKE_MAX_ATTEMPTS = 3      # Failed documents are retried this many times in total
+INTAKE_RETRY_SECONDS = 60    # Delay before the first retry, doubling after each failure
+
+def _file_sha256(file_path: str) -> str:
+    """Hash file contents in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_intake_record(record_path: str = INTAKE_RECORD_PATH) -> Dict:
+    """Load the record of processed documents, keyed by file path (each entry holds its sha256)"""
+    if os.path.exists(record_path):
+        with open(record_path, 'r') as f:
+            return json.load(f)
+    return {}
+
+def _save_intake_record(record: Dict, record_path: str):
+    """Write the record atomically so a crash never leaves it half-written"""
+    os.makedirs(os.path.dirname(record_path) or '.', exist_ok=True)
+    tmp_path = record_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp_path, record_path)
+
+def _scan_intake_folders(intake_folders: List[str]) -> Dict[str, Tuple[int, int]]:
+    """Map every candidate document to its (size, mtime) signature"""
+    found = {}
+    for folder in intake_folders:
+        folder_path = Path(folder)
+        if not folder_path.exists():
+            continue
+        for file in folder_path.rglob('*'):
+            name = file.name
+            if (name.startswith(('.', '~$')) or name.lower().endswith(INTAKE_IGNORED_SUFFIXES)
+                    or file.suffix.lower() not in INTAKE_EXTENSIONS):
+                continue
+            try:
+                stat = file.stat()
+            except OSError:
+                continue  # Removed or renamed mid-scan
+            if stat.st_size > 0:
+                found[str(file)] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+def _intake_supplier_name(file_path: str, intake_folders: List[str]) -> str:
+    """Use the supplier subfolder, or the file name for documents at the top level"""
+    path = Path(file_path)
+    for folder in intake_folders:
+        try:
+            relative = path.relative_to(folder)
+        except ValueError:
+            continue
+        if len(relative.parts) > 1:
+            return relative.parts[0]
+    return path.stem
+
+def _intake_needs_processing(state: Dict, path: str, content_hash: str) -> bool:
+    """New or changed content, or a failure whose retry is due (call with state["lock"] held)"""
+    if (path, content_hash) in state["queued"]:
+        return False
+    entry = state["record"].get(path)
+    if entry is None or entry.get("sha256") != content_hash:
+        return True
+    if entry["status"] == "success":
+        return False
+    return entry.get("attempts", 1) < INTAKE_MAX_ATTEMPTS and time.time() >= entry.get("retry_after", 0)
+
+def _intake_scanner(state: Dict):
+    """Poll the intake folders and queue documents once they stop changing"""
+    observed = {}  # path -> {"signature", "since"} while a file is still settling
+    stable = {}    # path -> (signature, content_hash) once it has settled
+    while not state["stop_event"].is_set():
+        now = time.monotonic()
+        current = _scan_intake_folders(state["intake_folders"])
+        for path in set(observed) - set(current):
+            del observed[path]
+        for path in set(stable) - set(current):
+            del stable[path]
+
+        for path, signature in current.items():
+            known = stable.get(path)
+            if known is None or known[0] != signature:
+                seen = observed.get(path)
+                if seen is None or seen["signature"] != signature:
+                    observed[path] = {"signature": signature, "since": now}
+                    continue
+                if now - seen["since"] < state["settle_seconds"]:
+                    continue
+                # Stable long enough: hash it once per version of the file
+                try:
+                    stable[path] = (signature, _file_sha256(path))
+                except OSError:
+                    continue
+                del observed[path]
+
+            content_hash = stable[path][1]
+            with state["lock"]:
+                if not _intake_needs_processing(state, path, content_hash):
+                    continue
+                state["queued"].add((path, content_hash))
+            # Keep extraction workers from being forked while this thread is mid-print
+            with EXTRACTION_FORK_LOCK:
+                print(f"📥 Queued: {path}")
+                state["queue"].put((path, content_hash))
+        state["stop_event"].wait(state["poll_seconds"])
+
+def _record_intake_result(state: Dict, extraction: Dict, content_hash: str):
+    """Generate the prompt for an extracted document and persist the outcome"""
+    file_path = extraction["file_path"]
+    entry = {
+        "sha256": content_hash,
+        "processed_at": pd.Timestamp.now().isoformat(timespec='seconds'),
+        "status": extraction["status"],
+        "reason": extraction["reason"]
+    }
+    if extraction["status"] == "success":
+        supplier_name = _intake_supplier_name(file_path, state["intake_folders"])
+        stem = Path(file_path).stem
+        result = generate_school_ai_analysis_package(
+            file_path, supplier_name, document_text=extraction["text"],
+            prompt_name=supplier_name if supplier_name == stem else f"{supplier_name} {stem}"
+        )
+        entry["status"] = result["status"]
+        entry["supplier_name"] = supplier_name
+        entry["prompt_path"] = result.get("prompt_path")
+        entry["reason"] = result.get("error")
+        # Kept so the coverage index can be rebuilt after a restart without re-extracting
+        entry["coverage_terms"] = coverage_terms_for_text(state["terms_index"], extraction["text"])
+        if state["coverage_index"] is not None and entry["status"] == "success":
+            add_term_sets_to_coverage_index(state["coverage_index"],
+                                            [(file_path, supplier_name, entry["coverage_terms"])])
+
+    with state["lock"]:
+        if entry["status"] != "success":
+            # Failures are retried with backoff instead of blocking the file for good
+            previous = state["record"].get(file_path) or {}
+            attempts = previous.get("attempts", 0) + 1 if previous.get("sha256") == content_hash else 1
+            entry["attempts"] = attempts
+            if attempts < INTAKE_MAX_ATTEMPTS:
+                delay = INTAKE_RETRY_SECONDS * 2 ** (attempts - 1)
+                entry["retry_after"] = time.time() + delay
+                print(f"❌ Intake failed for {file_path}: {entry['reason']} (retrying in {delay}s)")
+            else:
+                print(f"❌ Intake failed for {file_path}: {entry['reason']} "
+                      f"(gave up after {attempts} attempts; use requeue_intake_document to retry)")
+        state["record"][file_path] = entry
+        state["queued"].discard((file_path, content_hash))
+        _save_intake_record(state["record"], state["record_path"])
+
+def _intake_processor(state: Dict):
+    """Extract and generate prompts for queued documents in bounded batches"""
+    while not state["stop_event"].is_set():
+        try:
+            batch = [state["queue"].get(timeout=state["poll_seconds"])]
+        except queue.Empty:
+            continue
+        while len(batch) < state["max_batch"]:
+            try:
+                batch.append(state["queue"].get_nowait())
+            except queue.Empty:
+                break
+
+        # A file that changed after it was queued shows up twice: keep the
+        # newest hash and release the stale one so that content can be queued again
+        pending = {}
+        for file_path, content_hash in batch:
+            stale_hash = pending.get(file_path)
+            if stale_hash is not None and stale_hash != content_hash:
+                with state["lock"]:
+                    state["queued"].discard((file_path, stale_hash))
+            pending[file_path] = content_hash
+
+        try:
+            for extraction in iter_supervised_extractions(list(pending), **state["limits"]):
+                file_path = extraction["file_path"]
+                _record_intake_result(state, extraction, pending[file_path])
+                del pending[file_path]  # Only once its outcome is recorded
+        except Exception as e:
+            print(f"❌ Intake batch failed: {e}")
+            for file_path, content_hash in pending.items():
+                failure = {"file_path": file_path, "status": "failed", "text": "", "reason": str(e)}
+                try:
+                    _record_intake_result(state, failure, content_hash)
+                except Exception as record_error:
+                    print(f"❌ Could not record {file_path}: {record_error}")
+                    with state["lock"]:
+                        state["queued"].discard((file_path, content_hash))
+
+def requeue_intake_document(daemon: Dict, file_path: str):
+    """Forget a document's recorded outcome so the daemon processes it again"""
+    file_path = str(file_path)
+    with daemon["lock"]:
+        if daemon["record"].pop(file_path, None) is None:
+            print(f"⚠️ {file_path} is not in the intake record")
+            return
+        _save_intake_record(daemon["record"], daemon["record_path"])
+    print(f"🔁 Re-queued on next scan: {file_path}")
+
+def start_intake_daemon(intake_folders: List[str] = None,
+                        record_path: str = INTAKE_RECORD_PATH,
+                        poll_seconds: float = INTAKE_POLL_SECONDS,
+                        settle_seconds: float = INTAKE_SETTLE_SECONDS,
+                        max_batch: int = INTAKE_MAX_BATCH,
+                        coverage_index: Dict = None,
+                        **limits) -> Dict:
+    """Watch intake folders in the background and generate prompts for new documents.
+
+    If a coverage_index is given, documents already in the record are loaded
+    into it and new documents are added as they arrive (see rank_suppliers_by_coverage). Extra keyword arguments are passed to
+    iter_supervised_extractions (timeout_seconds, max_rss_mb, num_workers, ...).
+    Failed documents are retried with backoff; requeue_intake_document(daemon, path)
+    forces another run. Stop it with stop_intake_daemon(daemon).
+    """
+    intake_folders = intake_folders or INTAKE_FOLDERS
+    for folder in intake_folders:
+        os.makedirs(folder, exist_ok=True)
+
+    state = {
+        "intake_folders": intake_folders,
+        "record_path": record_path,
+        "record": load_intake_record(record_path),
+        "queued": set(),
+        "queue": queue.Queue(),
+        "lock": threading.Lock(),
+        "stop_event": threading.Event(),
+        "poll_seconds": poll_seconds,
+        "settle_seconds": settle_seconds,
+        "max_batch": max(1, max_batch),
+        "coverage_index": coverage_index,
+        "terms_index": coverage_index or build_coverage_index(),
+        "limits": limits
+    }
+    if coverage_index is not None:
+        restored = [(path, _intake_supplier_name(path, intake_folders), entry["coverage_terms"])
+                    for path, entry in state["record"].items()
+                    if entry["status"] == "success" and "coverage_terms" in entry]
+        add_term_sets_to_coverage_index(coverage_index, restored)
+        print(f"📊 Coverage index restored with {len(restored)} documents")
+    state["threads"] = [
+        threading.Thread(target=_intake_scanner, args=(state,), name="intake-scanner", daemon=True),
+        threading.Thread(target=_intake_processor, args=(state,), name="intake-processor", daemon=True)
+    ]
+    for thread in state["threads"]:
+        thread.start()
+
+    print(f"👀 Watching: {', '.join(intake_folders)}")
+    processed = sum(entry["status"] == "success" for entry in state["record"].values())
+    print(f"📒 {processed} documents already processed ({record_path})")
+    return state
+
+def stop_intake_daemon(daemon: Dict, timeout: float = None):
+    """Stop the intake daemon once the current batch finishes"""
+    daemon["stop_event"].set()
+    for thread in daemon["threads"]:
+        thread.join(timeout)
+    print("🛑 Intake daemon stopped")
+
+def run_intake_daemon(**kwargs):
+    """Run the intake daemon in the foreground until interrupted"""
+    daemon = start_intake_daemon(**kwargs)
+    try:
+        while all(thread.is_alive() for thread in daemon["threads"]):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_intake_daemon(daemon)
+
+print("✅ Watch-folder intake daemon ready!")
+
 # Cell 8: Test School AI Workflow
 def test_school_ai_workflow():
     """Test the school AI workflow with sample document"""
@@ -662,6 +1769,18 @@ Step 2: Use school AI
 Step 3: Process response
 >>> final_result = process_and_save_school_ai_analysis()
 
+👀 OPTION 3: DAEMON MODE (Automatic Intake)
+-------------------------------------------
+Watch the intake folders and generate prompts as files arrive:
+>>> daemon = start_intake_daemon()
+>>> stop_intake_daemon(daemon)
+
+- Files are picked up once they stop changing (partial copies are skipped)
+- Unchanged content is never processed twice
+- Failures are retried with backoff; force a rerun with:
+>>> requeue_intake_document(daemon, 'sample_documents/Acme/plan.pdf')
+- Record of processed documents: output_reports/intake_record.json
+
 📚 SCHOOL AI PLATFORMS TO TRY:
 -------------------------------
 ✅ ChatGPT (chat.openai.com) - Often available through school
@@ -681,7 +1800,9 @@ Step 3: Process response
 ------------------
 • Input documents: sample_documents/
 • Generated prompts: output_reports/SCHOOL_AI_PROMPT_*.txt
-• Final reports: output_reports/GAP_MEMO_*.md
+• Intake record: output_reports/intake_record.json
+• Final reports: output_reports/GAP_MEMO_*.md (.docx with render_memo_batch)
+• Portfolio results: output_reports/GAP_RESULTS_*.csv
 • Checklists: reference_checklists/
 
 🆘 TROUBLESHOOTING: